@@ -7,47 +7,66 @@ from nmeatools.nmea_data_lazy import Sentence_Factory
 from nmeatools.common import logged, Logging
 
 from types import SimpleNamespace
+from json import JSONEncoder
 import sys
 import logging
 from collections import Counter
 from pprint import pprint
 
+OUTPUT_BATCH = 32
+
 def sample_CP(listener):
     """
-    Chart Plotter. The background message cycle is filtered out. Reads until Ctrl-C.
+    Chart Plotter. The background message cycle is filtered out. Reads until Ctrl-C,
+    or until the listener is exhausted.
+    Output is written in batches of :data:`OUTPUT_BATCH` sentences;
+    any remainder, and the counts, are written when reading stops.
     """
-    background = ('GPXTE', 'GPRMC', 'GPDBT', 'GPDPT', 'GPMTW', 'GPVHW', 'GPGGA', 'GPGLL')
+    background = frozenset(('GPXTE', 'GPRMC', 'GPDBT', 'GPDPT', 'GPMTW', 'GPVHW', 'GPGGA', 'GPGLL'))
     counts = Counter()
     sentence_factory= Sentence_Factory()
+    encoder = JSONEncoder()
+    output = []
     try:
         for sentence_fields in listener:
             sentence= sentence_factory(*sentence_fields)
             if sentence._name not in background:
-                print(repr(sentence._name), sentence)
-                text = Encoder().encode(sentence)
-                print(text)
+                text = encoder.encode(sentence.to_json)
+                output.append(f"{sentence._name!r} {sentence}\n{text}\n")
+                if len(output) == OUTPUT_BATCH:
+                    sys.stdout.write(''.join(output))
+                    output.clear()
             counts[sentence._name] += 1
     except KeyboardInterrupt:
+        pass
+    finally:
+        sys.stdout.write(''.join(output))
         pprint(counts)
 
 def sample_GPS(listener, limit=16):
     """
     GPS. Displays selected messages until some limit is reached.
+    Output is written in batches of :data:`OUTPUT_BATCH` sentences.
     """
     counts = Counter()
     sentence_factory= Sentence_Factory()
+    output = []
     for sentence_fields in listener:
         counts['lines'] += 1
         sentence= sentence_factory(*sentence_fields)
         counts[sentence._name] += 1
         if sentence._name in ('GPRMC', 'GPGGA', 'GPGLL'):
             counts['print'] += 1
-            print( sentence )
+            output.append(f"{sentence}\n")
+            if len(output) == OUTPUT_BATCH:
+                sys.stdout.write(''.join(output))
+                output.clear()
         else:
             counts['skip'] += 1
         limit -= 1
         if limit == 0:
             break
+    sys.stdout.write(''.join(output))
     pprint(counts)
 
 
@@ -11,14 +11,46 @@ Defines a handy function for distance in Nautical Miles.
     :param lat_2: Latitude of point 2
     :param lon_2: Longitude of point 2
     :returns: distance, NM
+
+:func:`mi_haversine` and :func:`km_haversine` are the same for
+miles and kilometers. All three are generated with the radius folded
+into the code.
+
+..  function:: haversine_vector(lat_1, lon_1, lat_2, lon_2, R=NM)
+
+    Computes distances between corresponding points of four
+    parallel sequences of coordinates.
+
+    :returns: list of distances based on units of R.
+
+..  function:: haversine_to(lat, lon, lat_0, lon_0, R=NM)
+
+    Computes distances from many points to one reference point.
+
+    :returns: list of distances based on units of R.
+
+..  function:: cached_haversine(lat_1, lon_1, lat_2, lon_2, R=NM)
+
+    Computes distance, remembering recent results. This is for
+    repeated distances between the same points, e.g., a route replay.
+
+    :returns: distance based on units of R.
+
+..  function:: cos_latitudes(lat)
+
+    Computes the cosines of latitudes once, for repeated use
+    with :func:`haversine_to`.
 """
-from math import radians, sin, cos, sqrt, asin
-from functools import partial
+from math import pi, sin, cos, sqrt, asin
+from functools import lru_cache
 
 MI= 3959
 NM= 3440
 KM= 6373
 
+# Degrees to radians; a multiply by this is cheaper than calling radians().
+_DEG2RAD = pi / 180.0
+
 def haversine(lat_1: float, lon_1: float,
     lat_2: float, lon_2: float, R: float=NM) -> float:
     """Distance between points.
@@ -43,22 +75,173 @@ def haversine(lat_1: float, lon_1: float,
     >>> round(haversine(36.12, -86.67, 33.94, -118.40, R=6372.8), 5)
     2887.25995
     """
-    Δ_lat = radians(lat_2) - radians(lat_1)
-    Δ_lon = radians(lon_2) - radians(lon_1)
-    lat_1 = radians(lat_1)
-    lat_2 = radians(lat_2)
+    lat_1 = lat_1 * _DEG2RAD
+    lat_2 = lat_2 * _DEG2RAD
+    Δ_lat = lat_2 - lat_1
+    Δ_lon = (lon_2 - lon_1) * _DEG2RAD
 
-    a = sqrt(sin(Δ_lat/2)**2 + cos(lat_1)*cos(lat_2)*sin(Δ_lon/2)**2)
+    sin_lat = sin(Δ_lat/2)
+    sin_lon = sin(Δ_lon/2)
+    a = sqrt(sin_lat*sin_lat + cos(lat_1)*cos(lat_2)*sin_lon*sin_lon)
     c = 2*asin(a)
 
     return R * c
 
-nm_haversine = partial(haversine, R=NM)
+def haversine_vector(lat_1, lon_1, lat_2, lon_2, R: float=NM) -> list:
+    """Distances between many pairs of points.
+
+    Each argument is an iterable of coordinates; the distances are computed
+    pairwise, in order, for as many points as the shortest iterable provides.
+    This is handy for post-processing a captured log, where the loop over
+    the fixes stays out of the caller's code.
+
+    The formula is written inline, with ``2R`` and the half-angle conversion
+    computed once per call, so there's no function call for each pair.
+
+    :param lat_1: Latitudes of the first points
+    :param lon_1: Longitudes of the first points
+    :param lat_2: Latitudes of the second points
+    :param lon_2: Longitudes of the second points
+    :param R: Mean earth radius in desired units. R=NM is the default.
+    :returns: list of distances based on units of R.
+
+    >>> [round(d, 2) for d in haversine_vector([36.12, 36.12], [-86.67, -86.67], [33.94, 36.12], [-118.40, -86.67])]
+    [1558.53, 0.0]
+    """
+    diameter = 2*R
+    half_rad = _DEG2RAD/2
+    distances = []
+    for lat_a, lon_a, lat_b, lon_b in zip(lat_1, lon_1, lat_2, lon_2):
+        lat_a = lat_a * _DEG2RAD
+        lat_b = lat_b * _DEG2RAD
+        sin_lat = sin((lat_b - lat_a) * 0.5)
+        sin_lon = sin((lon_b - lon_a) * half_rad)
+        distances.append(diameter * asin(sqrt(sin_lat*sin_lat + cos(lat_a)*cos(lat_b)*sin_lon*sin_lon)))
+    return distances
+
+def haversine_to(lat, lon, lat_0: float, lon_0: float, R: float=NM, cos_lat=None) -> list:
+    """Distances from many points to one reference point.
+
+    The reference point's radians and cosine are computed once, not once
+    per point; this is the common case of distance to a home waypoint
+    for every fix in a capture.
+
+    When the same points are measured against many reference points,
+    their cosines can be computed once with :func:`cos_latitudes` and
+    provided as ``cos_lat``.
+
+    :param lat: Latitudes of the points
+    :param lon: Longitudes of the points
+    :param lat_0: Latitude of the reference point
+    :param lon_0: Longitude of the reference point
+    :param R: Mean earth radius in desired units. R=NM is the default.
+    :param cos_lat: Optional cosines of the points' latitudes.
+    :returns: list of distances based on units of R.
+
+    >>> [round(d, 2) for d in haversine_to([33.94, 36.12], [-118.40, -86.67], 36.12, -86.67)]
+    [1558.53, 0.0]
+    >>> lat, lon = [33.94, 36.12], [-118.40, -86.67]
+    >>> [round(d, 2) for d in haversine_to(lat, lon, 36.12, -86.67, cos_lat=cos_latitudes(lat))]
+    [1558.53, 0.0]
+    >>> [round(d, 2) for d in haversine_to(iter(lat), iter(lon), 36.12, -86.67)]
+    [1558.53, 0.0]
+    """
+    lat_0 = lat_0 * _DEG2RAD
+    cos_lat_0 = cos(lat_0)
+    distances = []
+    if cos_lat is None:
+        for lat_1, lon_1 in zip(lat, lon):
+            lat_1 = lat_1 * _DEG2RAD
+            sin_lat = sin((lat_1 - lat_0)/2)
+            sin_lon = sin((lon_1 - lon_0)*_DEG2RAD/2)
+            a = sqrt(sin_lat*sin_lat + cos(lat_1)*cos_lat_0*sin_lon*sin_lon)
+            distances.append(2*R*asin(a))
+    else:
+        for lat_1, lon_1, cos_lat_1 in zip(lat, lon, cos_lat):
+            sin_lat = sin((lat_1*_DEG2RAD - lat_0)/2)
+            sin_lon = sin((lon_1 - lon_0)*_DEG2RAD/2)
+            a = sqrt(sin_lat*sin_lat + cos_lat_1*cos_lat_0*sin_lon*sin_lon)
+            distances.append(2*R*asin(a))
+    return distances
+
+def cos_latitudes(lat) -> list:
+    """Cosines of latitudes, for use with :func:`haversine_to`.
+
+    :param lat: Latitudes, degrees
+    :returns: list of cosines.
+
+    >>> [round(c, 4) for c in cos_latitudes([0.0, 60.0])]
+    [1.0, 0.5]
+    """
+    return [cos(lat_1 * _DEG2RAD) for lat_1 in lat]
+
+@lru_cache(maxsize=4096)
+def _cached_haversine(lat_1, lon_1, lat_2, lon_2, R):
+    return haversine(lat_1, lon_1, lat_2, lon_2, R)
+
+def cached_haversine(lat_1: float, lon_1: float,
+    lat_2: float, lon_2: float, R: float=NM) -> float:
+    """Distance between points, memoized.
+
+    The coordinates are rounded to 6 decimal places (about 0.1 m), well
+    below the 4 decimal places of NMEA minutes. Fixes that differ only by
+    float noise share one cache entry.
+
+    :param lat_1: Latitude of point 1
+    :param lon_1: Longitude of point 1
+    :param lat_2: Latitude of point 2
+    :param lon_2: Longitude of point 2
+    :param R: Mean earth radius in desired units. R=NM is the default.
+    :returns: distance based on units of R.
+
+    >>> round(cached_haversine(36.12, -86.67, 33.94, -118.40), 2)
+    1558.53
+    >>> round(cached_haversine(36.12, -86.67, 33.94, -118.40 + 1e-9), 2)
+    1558.53
+    """
+    return _cached_haversine(
+        round(lat_1, 6), round(lon_1, 6), round(lat_2, 6), round(lon_2, 6), R)
+
+def _fixed_radius(name: str, R: float):
+    """Build a haversine function specialized for one radius.
+
+    The source is generated with 2R and the degree conversions folded in as
+    literals, then compiled. The result does only arithmetic and math-module
+    calls, with no radius parameter to pass or multiply.
+
+    :param name: Name for the new function.
+    :param R: Mean earth radius in desired units.
+    :returns: function of (lat_1, lon_1, lat_2, lon_2).
+    """
+    source = (
+        f"def {name}(lat_1, lon_1, lat_2, lon_2):\n"
+        f"    lat_1 = lat_1 * {_DEG2RAD!r}\n"
+        f"    lat_2 = lat_2 * {_DEG2RAD!r}\n"
+        f"    sin_lat = sin((lat_2 - lat_1) * 0.5)\n"
+        f"    sin_lon = sin((lon_2 - lon_1) * {_DEG2RAD/2!r})\n"
+        f"    return {2*R!r} * asin(sqrt(sin_lat*sin_lat + cos(lat_1)*cos(lat_2)*sin_lon*sin_lon))\n"
+    )
+    namespace = {'__name__': __name__, 'sin': sin, 'cos': cos, 'sqrt': sqrt, 'asin': asin}
+    exec(compile(source, f"<{__name__}.{name}>", "exec"), namespace)
+    function = namespace[name]
+    function.__qualname__ = name
+    function.__doc__ = f"Distance between points, :func:`haversine` with R={R}."
+    return function
+
+nm_haversine = _fixed_radius('nm_haversine', NM)
+mi_haversine = _fixed_radius('mi_haversine', MI)
+km_haversine = _fixed_radius('km_haversine', KM)
 
 __test__ = {
-    'partial': '''\
+    'nm_haversine': '''\
 >>> round(nm_haversine(36.12, -86.67, 33.94, -118.40), 2)
 1558.53
+>>> round(mi_haversine(36.12, -86.67, 33.94, -118.40), 2) == round(haversine(36.12, -86.67, 33.94, -118.40, R=MI), 2)
+True
+>>> round(km_haversine(36.12, -86.67, 33.94, -118.40), 2) == round(haversine(36.12, -86.67, 33.94, -118.40, R=KM), 2)
+True
+>>> nm_haversine.__module__ == __name__, nm_haversine.__qualname__
+(True, 'nm_haversine')
 ''',
 }
 
@@ -63,10 +63,13 @@ import sys
 from pathlib import Path
 from types import SimpleNamespace
 from collections import Counter
+import textwrap
 import logging
 
 logger = logging.getLogger(__name__)
 
+PROGRESS_BATCH = 16
+
 def sentence_iter(options):
     """
     Filtered reader of sentnces. Rejects any sentences from the background list.
@@ -74,6 +77,10 @@ def sentence_iter(options):
     Currently, the reject list is::
     
         ('GPRMC', 'GPGGA', 'GPGLL', 'GPGSA', 'GPGSV', 'GPVTG', 'GPZDA', 'GPXTE')
+    
+    Progress is shown on stderr with ``.`` for a background sentence and
+    ``+`` for a captured sentence. The marks are written in batches of
+    :data:`PROGRESS_BATCH`, not one write and flush per sentence.
      
     :param options: Options namespace, must have the following items.
         :input: the mounted device, often /dev/cu.usbserial-A6009TFG
@@ -82,8 +89,9 @@ def sentence_iter(options):
     :returns: yields individual sentences that are not in a list of
         background messages.
     """
-    background = ('GPRMC', 'GPGGA', 'GPGLL', 'GPGSA', 'GPGSV', 'GPVTG', 'GPZDA', 'GPXTE')
+    background = frozenset(('GPRMC', 'GPGGA', 'GPGLL', 'GPGSA', 'GPGSV', 'GPVTG', 'GPZDA', 'GPXTE'))
     bg_count = fg_count = 0
+    progress = []
     device = SimpleNamespace(
         port=options.input,
         baud=options.baud,
@@ -94,15 +102,20 @@ def sentence_iter(options):
             for sentence_fields in plotter:
                 sentence= sentence_factory(*sentence_fields)
                 if sentence._name in background:
-                    print('.', end='', file=sys.stderr)
+                    progress.append('.')
                     bg_count += 1
                 else:
                     yield sentence
-                    print('+', end='', file=sys.stderr)
+                    progress.append('+')
                     fg_count += 1
-                sys.stderr.flush()
+                if len(progress) == PROGRESS_BATCH:
+                    sys.stderr.write(''.join(progress))
+                    sys.stderr.flush()
+                    progress.clear()
     except KeyboardInterrupt:
         pass
+    sys.stderr.write(''.join(progress))
+    sys.stderr.flush()
     logger.info(f"Ignored  {bg_count}")
     logger.info(f"Captured {fg_count}")
 
@@ -110,14 +123,22 @@ def capture(target_file, sentence_source):
     """
     Write captured messages to the target file.
     
+    Each sentence is encoded and written as it arrives. A long capture
+    doesn't accumulate in memory, and the sentences captured so far
+    are already in the file if the capture is interrupted.
+    
     :param target_file: an open file to which JSON text is written.
     :param sentence_source: an iterable source of sentences.
     """
-    body = list(sentence_source)
-    text = Encoder(indent=2, sort_keys=True).encode(body)
-    target_file.write(text)
-    target_file.write('\n')
-    count = len(body)
+    encoder = Encoder(indent=2, sort_keys=True)
+    count = 0
+    for sentence in sentence_source:
+        text = textwrap.indent(encoder.encode(sentence), '  ')
+        target_file.write(',\n' if count else '[\n')
+        target_file.write(text)
+        target_file.flush()
+        count += 1
+    target_file.write('\n]\n' if count else '[]\n')
     logger.info(f"Wrote {count} to {target_file.name}")
       
 def get_options(argv):
@@ -8,11 +8,28 @@ http://catb.org/gpsd/AIVDM.html describes !AIVDM messages, these use a 6-bit
 protocol similar to base-64 encoding.
 """
 
-from functools import reduce
-from operator import xor
-import doctest
 import sys
 
+def xor_fold(data):
+    """XOR of all the bytes in a sentence body.
+
+    Rather than folding one byte at a time, the body is converted to a single
+    integer and folded in half repeatedly. Each fold XORs all of the byte
+    lanes at once, so an 80-byte sentence needs seven folds, not 80 steps.
+
+    >>> hex(xor_fold(b"GPGLL,2542.9243,N,08013.6310,W,162823.000,A"))
+    '0x29'
+    >>> xor_fold(b"")
+    0
+    """
+    folded = int.from_bytes(data, 'little')
+    width = len(data)
+    while width > 1:
+        width = (width + 1) >> 1
+        bits = width << 3
+        folded = (folded >> bits) ^ (folded & ((1 << bits) - 1))
+    return folded
+
 def validate(aLine):
     """
     >>> validate(b"$GPGSA,A,2,29,19,28,,,,,,,,,,23.4,12.1,20.0*0F")
@@ -40,10 +57,13 @@ def validate(aLine):
     [b'GPGLL', b'2542.9243', b'N', b'08013.6310', b'W', b'162823.000', b'A']
     """
     sentence, star, checksum = aLine.rpartition(b'*')
-    assert sentence[0] in b'$!', f"Unexpected {sentence[0]} not in b'$!'
+    assert sentence[0] in b'$!', f"Unexpected {sentence[0]} not in b'$!'"
+    body = sentence[1:]
     if star == b'*':
-        cs = reduce(xor, sentence[1:])
+        cs = xor_fold(body)
         assert int(checksum, 16) == cs
-    return sentence[1:].split(b',')
+    return body.split(b',')
 
-doctest.testmod(verbose=False)
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod(verbose=False)
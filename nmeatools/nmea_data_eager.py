@@ -26,8 +26,8 @@ These are not (currently) interpreted.
 from nmeatools.common import logged, Logging
 
 import time
-from pprint import pprint, pformat
-from collections import Callable, namedtuple
+from pprint import pprint
+from collections import namedtuple
 import logging
 import sys
 import datetime
@@ -41,26 +41,43 @@ def text( source ):
     """
     return source.decode('ascii')
 
+# The fixed-width digit runs in times, dates and angles are decoded from the
+# byte values directly (48 is ``ord('0')``), avoiding a slice and an int()
+# parse for each pair of digits. The run is checked with isdigit() first, so
+# a malformed field raises ValueError, as int() would.
+
 def utc_time(source):
     """Convert source bytes to UTC time as (H, M, S) triple
     HHMMSS.000
     
     >>> utc_time(b'123456.000')
     (12, 34, 56.0)
+    >>> utc_time(b' 23456.000')
+    Traceback (most recent call last):
+    ...
+    ValueError: invalid time b' 23456.000'
     """
     if source:
-        return int(source[:2]), int(source[2:4]), float(source[4:])
+        if not (len(source) >= 4 and source[:4].isdigit()):
+            raise ValueError(f"invalid time {source!r}")
+        return (source[0]-48)*10 + source[1]-48, (source[2]-48)*10 + source[3]-48, float(source[4:])
     return None, None, None
 
 def utc_date(source):
-    """Convert source bytes to UTC date.
-    mmddyy
+    """Convert source bytes to UTC date as (D, M, Y) triple
+    ddmmyy
 
     >>> utc_date(b'091056')
     (9, 10, 56)
+    >>> utc_date(b'09 056')
+    Traceback (most recent call last):
+    ...
+    ValueError: invalid date b'09 056'
     """
     if source:
-        return int(source[:2]), int(source[2:4]), int(source[4:])
+        if not (len(source) == 6 and source.isdigit()):
+            raise ValueError(f"invalid date {source!r}")
+        return (source[0]-48)*10 + source[1]-48, (source[2]-48)*10 + source[3]-48, (source[4]-48)*10 + source[5]-48
     return None, None, None
 
 def lat(source):
@@ -69,11 +86,17 @@ def lat(source):
     
     >>> lat(b'2543.7024')
     (25, 43.7024)
+    >>> lat(b' 543.7024')
+    Traceback (most recent call last):
+    ...
+    ValueError: invalid latitude b' 543.7024'
     """
     if len(source) == 0: return None, None
-    dd= int(source[:2])
+    if not (len(source) >= 2 and source[:2].isdigit()):
+        raise ValueError(f"invalid latitude {source!r}")
+    dd= (source[0]-48)*10 + source[1]-48
     mm= float(source[2:])
-    return int(dd), float(mm)
+    return dd, mm
 
 def lon(source):
     """Convert source bytes to longitude (deg, mim) pair.
@@ -81,11 +104,17 @@ def lon(source):
     
     >>> lon(b'08014.5267')
     (80, 14.5267)
+    >>> lon(b'0-014.5267')
+    Traceback (most recent call last):
+    ...
+    ValueError: invalid longitude b'0-014.5267'
     """
     if len(source) == 0: return None, None
-    dd= int(source[:3])
+    if not (len(source) >= 3 and source[:3].isdigit()):
+        raise ValueError(f"invalid longitude {source!r}")
+    dd= (source[0]-48)*100 + (source[1]-48)*10 + source[2]-48
     mm= float(source[3:])
-    return int(dd), float(mm)
+    return dd, mm
 
 def nfloat(source):
     """Convert to float or None
@@ -94,8 +123,7 @@ def nfloat(source):
     >>> nfloat(b'123.45')
     123.45
     """
-    if len(source) == 0: return None
-    return float(source)
+    return float(source) if source else None
 
 def nint(source):
     """Convert to int or None
@@ -104,48 +132,135 @@ def nint(source):
     >>> nint(b'123')
     123
     """
-    if len(source) == 0: return None
-    return int(source)
+    return int(source) if source else None
     
+# Source templates for conversions that compile_fields() writes inline.
+INLINE = {
+    text: "{0}.decode('ascii')",
+    nint: "int({0}) if {0} else None",
+    nfloat: "float({0}) if {0} else None",
+}
+
 # Define each field to be decoded from the message.
 Field = namedtuple('Field', ['title', 'name', 'conversion'])
 
+def compile_fields(fields):
+    """Generate a function that applies a sequence of :class:`Field` conversions.
+    
+    The source is straight-line code with one assignment per field, so
+    building a sentence doesn't loop over the fields, look up each
+    field's attributes, or use :func:`setattr`.
+    The simple conversions, :func:`text`, :func:`nint`, and :func:`nfloat`,
+    are written inline rather than called.
+    A field with no matching argument is skipped; a conversion that raises
+    :exc:`ValueError` (or :exc:`IndexError` for a truncated fixed-width field)
+    is logged and its attribute is left unset.
+    
+    >>> convert = compile_fields([Field('Count', 'count', nint), Field('Size', 'size', nfloat)])
+    >>> class Target: pass
+    >>> t = Target()
+    >>> convert(t, (b'TARGET', b'42'))
+    >>> t.count
+    42
+    >>> hasattr(t, 'size')
+    False
+    >>> convert.__module__ == __name__, GPRMC._convert.__qualname__
+    (True, 'GPRMC._convert')
+    """
+    namespace = {}
+    lines = ["def convert(self, args):", "    n = len(args)"]
+    for position, field in enumerate(fields, start=1):
+        namespace[f"field_{position}"] = field
+        namespace[f"conversion_{position}"] = field.conversion
+        template = INLINE.get(field.conversion, f"conversion_{position}({{0}})")
+        lines.extend([
+            f"    if n > {position}:",
+            f"        try:",
+            f"            self.{field.name} = {template.format(f'args[{position}]')}",
+            f"        except (ValueError, IndexError) as e:",
+            f"            self.log.error(f\"{{e}} {{field_{position}.title}} {{field_{position}.name}} {{conversion_{position}}} {{args[{position}]}}\")",
+        ])
+    namespace['__name__'] = __name__
+    exec(compile("\n".join(lines), f"<{__name__}.compile_fields>", "exec"), namespace)
+    return namespace['convert']
+
+class SentenceType(type):
+    """Metaclass for :class:`Sentence` that provides ``__slots__``.
+    
+    A class that doesn't define ``__slots__`` gets one slot for each
+    of its ``fields`` and one for each name in its ``derived`` sequence:
+    the attributes its ``__init__`` computes from the fields.
+    Instances have no ``__dict__``, so they're smaller and attribute
+    stores go directly to the slot.
+    """
+    def __new__(mcs, name, bases, namespace, **kw):
+        if '__slots__' not in namespace:
+            namespace['__slots__'] = tuple(
+                field.name for field in namespace.get('fields', ())
+            ) + tuple(namespace.get('derived', ()))
+        return super().__new__(mcs, name, bases, namespace, **kw)
+
 @logged
-class Sentence:
+class Sentence(metaclass=SentenceType):
     """Superclass for NMEA0183 Sentences.
         
     Each subclass provides a value for ``fields``.
     This sequence if :class:`Field` objects is used to convert the items in the 
-    message from bytes to useful values.
+    message from bytes to useful values. When a subclass is defined, its
+    ``fields`` are compiled into a ``_convert()`` method by :func:`compile_fields`.
+    
+    A subclass that computes additional attributes in its ``__init__``
+    names them in ``derived``; see :class:`SentenceType`.
     
     There are two fields common to all sentences.
     
     :_name:
         The sentence type as text. The bytes are decoded from ASCII.
     :_args:
-        The tuple with the original argument values as Python text.
-        These have been decoded from ASCII, which is (perhaps) not the best
-        idea, but it makes access simple. 
+        The original argument values as a list of Python text.
+        The whole sentence is kept as a single bytes object, and is
+        decoded from ASCII and split only when this is used, for example,
+        by the :class:`Encoder`. 
     """
+    __slots__ = ('_name', '_raw')
     fields= []  # Sequence of Field definitions.
+    derived= ()  # Names of attributes computed from the fields.
+    def __init_subclass__(cls, **kw):
+        super().__init_subclass__(**kw)
+        cls._convert = compile_fields(cls.fields)
+        cls._convert.__qualname__ = f"{cls.__qualname__}._convert"
+
     def __init__( self, *args ):
         """Generic sentence creation.
         
-        1. Save the name and args.
+        1. Save the name as text and the whole sentence as one bytes object.
         
-        2. Examine each field and apply the conversion function to set additional attributes.
+        2. Apply the compiled field conversions to set additional attributes.
         """
         self._name= args[0].decode('ascii')
-        self._args = [arg.decode('ascii') for arg in args[1:]]
-        for field, arg in zip(self.fields, args[1:]):
-            try:
-                setattr(self, field.name, field.conversion(arg))
-            except ValueError as e:
-                self.log.error(f"{e} {field.title} {field.name} {field.conversion} {arg}")
+        self._raw = b','.join(args)
+        self._convert(args)
+
+    @property
+    def _args( self ):
+        """The args as text.
+        
+        The whole sentence is kept as one bytes object, so it's decoded with
+        one call and then split, rather than decoding each field. The same
+        join-then-split approach is used wherever a sequence of fields moves
+        between bytes and text, here and in :mod:`nmeatools.nmea_data_lazy`.
+        """
+        return self._raw.decode('ascii').split(',')[1:]
 
     def __repr__( self ):
-        value = pformat(self.__dict__)
-        return f"{self._name} {value}"
+        """The name, the converted ``fields``, and the ``derived`` attributes."""
+        names = [field.name for field in self.fields] + list(self.derived)
+        items = ', '.join(
+            f"{name}={getattr(self, name)!r}"
+            for name in names
+            if hasattr(self, name)
+        )
+        return f"{self._name}({items})"
 
 @logged
 class UnknownSentence(Sentence):
@@ -155,7 +270,15 @@ class UnknownSentence(Sentence):
         return f"{self._name} {self._args}"
 
 class GPRMC(Sentence):
-    """Position and time"""
+    """Position and time
+    
+    >>> s = GPRMC(*b'GPRMC,002823.000,A,2542.9243,N,08013.6310,W,0.14,59.53,180214,,'.split(b','))
+    >>> s.utc
+    datetime.datetime(2014, 2, 18, 0, 28, 23)
+    >>> s = GPRMC(*b'GPRMC,002823.000,V,2542.9243,N,08013.6310,W,0.14,59.53,000000,,'.split(b','))
+    >>> print(s.utc)
+    None
+    """
     fields = [
         Field('UTC Time', 'time_utc', utc_time),
         Field('Status', 'status', text),
@@ -169,15 +292,19 @@ class GPRMC(Sentence):
         Field('Magnetic variation', 'mag_var', nfloat),
         Field('Magnetic variation', 'mag_var_flag', text),
     ]
+    derived = ('utc', 'lat_deg', 'lat_min', 'lon_deg', 'lon_min')
     def __init__(self, *args):
         super().__init__(*args)
         # Calculate proper UTC date/time
         dd, mm, yy = self.date_utc
         HH, MM, SS = self.time_utc
-        if dd and mm and yy and HH and MM and SS:
-            self.utc = datetime.datetime(2000+yy, mm, mm, HH, MM, int(SS))
-        else:
-            self.utc = None
+        self.utc = None
+        if dd is not None and HH is not None:
+            try:
+                self.utc = datetime.datetime(2000+yy, mm, dd, HH, MM, int(SS))
+            except ValueError as e:
+                # Usually the all-zero date sent before a fix.
+                self.log.debug(f"{e} UTC {self.date_utc} {self.time_utc}")
         self.lat_deg, self.lat_min = self.lat
         self.lon_deg, self.lon_min = self.lon
     def __repr__( self ):
@@ -209,10 +336,11 @@ class GPGGA(Sentence):
     #     1 = Valid SPS;
     #     2 = Valid DGPS;
     #     3 = Valid PPS.
+    derived = ('utc', 'lat_deg', 'lat_min', 'lon_deg', 'lon_min')
     def __init__( self, *args ):
         super().__init__( *args )
         HH, MM, SS = self.time_utc
-        if HH and MM and SS:
+        if HH is not None:
             self.utc = datetime.time(HH, MM, int(SS))
         else:
             self.utc = None
@@ -236,10 +364,11 @@ class GPGLL(Sentence):
         ]
     # Status Codes:
     # A = valid, V = invalid
+    derived = ('utc', 'lat_deg', 'lat_min', 'lon_deg', 'lon_min', 'valid')
     def __init__( self, *args ):
         super().__init__( *args )
         HH, MM, SS = self.time_utc
-        if HH and MM and SS:
+        if HH is not None:
             self.utc= datetime.time(HH, MM, int(SS))
         else:
             self.utc = None
@@ -274,29 +403,65 @@ class GPGSA(Sentence):
         Field('Vertical dilution of precision (VDOP)', 'vdop', nfloat),
         ]
 
+def satellite(number):
+    """Properties for the id, elevation, azimuth, and signal to noise ratio
+    of one satellite in a :class:`GPGSV` sentence's ``sats``.
+    
+    A satellite that's not in the sentence has no attributes.
+    """
+    def item(index):
+        def get(self):
+            try:
+                return self.sats[number-1][index]
+            except IndexError:
+                raise AttributeError(f"no satellite {number}") from None
+        return property(get)
+    return tuple(item(index) for index in range(4))
+
 class GPGSV(Sentence):
-    """Satellites in view"""
+    """Satellites in view
+    
+    Up to four satellites follow the leading fields, each as an
+    (id, elevation, azimuth, signal to noise) tuple in ``sats``.
+    These are all converted by one pass over the arguments.
+    
+    >>> s = GPGSV(*b'GPGSV,3,3,10,27,08,303,27,12,00,139,'.split(b','))
+    >>> s.sats
+    ((27, 8, 303, 27), (12, 0, 139, None))
+    >>> s.sat2_az
+    139
+    >>> hasattr(s, 'sat3_id')
+    False
+    >>> s
+    GPGSV(num=3, seq=3, satinview=10, sats=((27, 8, 303, 27), (12, 0, 139, None)))
+    """
     fields= [
         Field('Number of messages (1 to 9)', 'num', nint),
         Field('Sequence number', 'seq', nint),
         Field('Satellites in view', 'satinview', nint),
-        Field('Satellite ID 1 (1-32)', 'sat1_id', nint),
-        Field('Elevation in degrees (0-90)', 'sat1_el', nint),
-        Field('Azimuth in degrees (0-359)', 'sat1_az', nint),
-        Field('Signal to noise ration in dBHZ (0-99)', 'sat1_sn', nint),
-        Field('Satellite ID 2 (1-32)', 'sat2_id', nint),
-        Field('Elevation in degrees (0-90)', 'sat2_el', nint),
-        Field('Azimuth in degrees (0-359)', 'sat2_az', nint),
-        Field('Signal to noise ration in dBHZ (0-99)', 'sat2_sn', nint),
-        Field('Satellite ID 3 (1-32)', 'sat3_id', nint),
-        Field('Elevation in degrees (0-90)', 'sat3_el', nint),
-        Field('Azimuth in degrees (0-359)', 'sat3_az', nint),
-        Field('Signal to noise ration in dBHZ (0-99)', 'sat3_sn', nint),
-        Field('Satellite ID 4 (1-32)', 'sat4_id', nint),
-        Field('Elevation in degrees (0-90)', 'sat4_el', nint),
-        Field('Azimuth in degrees (0-359)', 'sat4_az', nint),
-        Field('Signal to noise ration in dBHZ (0-99)', 'sat4_sn', nint),
     ]
+    # Each satellite is four fields:
+    #     Satellite ID (1-32);
+    #     Elevation in degrees (0-90);
+    #     Azimuth in degrees (0-359);
+    #     Signal to noise ration in dBHZ (0-99).
+    derived = ('sats',)
+    sat1_id, sat1_el, sat1_az, sat1_sn = satellite(1)
+    sat2_id, sat2_el, sat2_az, sat2_sn = satellite(2)
+    sat3_id, sat3_el, sat3_az, sat3_sn = satellite(3)
+    sat4_id, sat4_el, sat4_az, sat4_sn = satellite(4)
+    def __init__( self, *args ):
+        super().__init__( *args )
+        try:
+            # nint(), inline.
+            values = [int(v) if v else None for v in args[4:20]]
+        except ValueError as e:
+            self.log.error(f"{e} Satellites {args[4:20]}")
+            return
+        self.sats = (
+            tuple(values[0:4]), tuple(values[4:8]),
+            tuple(values[8:12]), tuple(values[12:16])
+        )[:(len(values)+3)//4]
 
 class GPVTG(Sentence):
     """Course over ground"""
@@ -361,6 +526,7 @@ class GPWPL(Sentence):
         Field('E/W Indicator', 'lon_h', text),
         Field("Name", "name", text),        
     ]
+    derived = ('lat_deg', 'lat_min', 'lon_deg', 'lon_min', 'latitude', 'longitude')
     def __init__( self, *args ):
         super().__init__( *args )
         self.lat_deg, self.lat_min = self.lat_src
@@ -397,14 +563,21 @@ class GPRTE(Sentence):
         Field("Current or Waypoint", "status", text),
         Field("Name or Number", "id", text),
     ]
+    derived = ('waypoints',)
     def __init__( self, *args ):
         super().__init__( *args )
         self.waypoints = self._args[5:]
     def __repr__( self ):
         return f"{self._name} {self.id!r} {self.sentence} {self.status} {self.waypoints}"
         
+# Map sentence header to :class:`Sentence` subclass. All subclasses are defined above.
+_SENTENCE_CLASSES = {
+    class_.__name__.encode('ascii'): class_ 
+    for class_ in Sentence.__subclasses__()
+}
+
 @logged
-class Sentence_Factory( Callable ):
+class Sentence_Factory:
     """
     Given a sequence of values, locate the class with a name that
     matches the sentence header and instantiate that class.
@@ -420,31 +593,18 @@ class Sentence_Factory( Callable ):
     >>> fields = b'GPVTG,59.53,T,,M,0.14,N,0.3,K'.split(b',')
     >>> s = sf(*fields)
     >>> s
-    GPVTG {'_args': ['59.53', 'T', '', 'M', '0.14', 'N', '0.3', 'K'],
-     '_name': 'GPVTG',
-     'course_1': 59.53,
-     'course_2': None,
-     'ref_1': 'T',
-     'ref_2': 'M',
-     'sog_1': 0.14,
-     'sog_2': 0.3,
-     'units_sog_1': 'N',
-     'units_sog_2': 'K'}
+    GPVTG(course_1=59.53, ref_1='T', course_2=None, ref_2='M', sog_1=0.14, units_sog_1='N', sog_2=0.3, units_sog_2='K')
      
     """
-    sentence_class_map = {
-        class_.__name__.encode('ascii'): class_ 
-        for class_ in Sentence.__subclasses__()
-    }
-    def __call__(self, *args):
-        self.log.debug(args)
-        class_= self.sentence_class_map.get(args[0])
+    sentence_class_map = _SENTENCE_CLASSES
+    def __call__(self, *args, _map=_SENTENCE_CLASSES):
+        # The map is bound as a default to make it a local variable.
+        class_= _map.get(args[0])
         if class_:
-            sentence= class_(*args)
-            return sentence
-        else:
-            self.log.debug(f"Don't recognize {args[0]}")
-            return UnknownSentence(*args)
+            return class_(*args)
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(f"Don't recognize {args!r}")
+        return UnknownSentence(*args)
 
 @logged
 class Encoder(JSONEncoder):
@@ -517,12 +677,15 @@ class Decoder(JSONDecoder):
         
     def nmea_object_hook(self, as_dict):
         if '_class' in as_dict:
-            # Should be Sentence_Factory() instance.
-            class_ = eval(as_dict['_class'])
+            # Should be the name of a Sentence subclass.
+            class_ = _SENTENCE_CLASSES[as_dict['_class'].encode('ascii')]
             # Items must be built from bytes. True fact.
-            return class_(as_dict['_name'].encode('ascii'), *[v.encode('ascii') for v in as_dict['_args']])
+            # Join, encode and split, as in Sentence._args.
+            text = ','.join([as_dict['_name'], *as_dict['_args']])
+            return class_(*text.encode('ascii').split(b','))
         else:
             return super().object_hook(as_dict)
 
-import doctest
-doctest.testmod(verbose=False)
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod(verbose=False)
@@ -49,11 +49,20 @@ Unit Tests
 >>> obj = json.loads(txt, object_hook=decode)
 >>> print(obj)
 GPWPL 51°28.62′N 0°27.58′W EGLL
+
+The :meth:`Sentence.dumps` method and :func:`loads` function do the same
+with one shared encoder and decoder, writing compact JSON.
+
+>>> txt = s2.dumps()
+>>> print(txt)
+{"_class":"GPWPL","_args":["GPWPL","5128.62","N","00027.58","W","EGLL"]}
+>>> print(loads(txt))
+GPWPL 51°28.62′N 0°27.58′W EGLL
 """
 
 from nmeatools.common import logged, Logging
 import json
-from collections.abc import Callable
+import logging
 
 class Field:
     """
@@ -70,26 +79,35 @@ class Field:
 
     ``f = Field(1, "Description", "f", lambda b: b.decode('ascii'))``
     
+    The converted value is cached in the instance under the attribute's name.
+    This is a non-data descriptor, so later reads find the cached value
+    without calling :meth:`__get__` or doing the conversion again.
+    
     >>> class Sample(Sentence):
     ...     f = Field(1, "title", "f", lambda b: b.decode('ascii'))
     >>> s = Sample(b'Sample', b'text')
     >>> s.f
     'text'
+    >>> s.__dict__['f']
+    'text'
+    >>> Sample(b'Sample', b'other').f
+    'other'
     """
     def __init__(self, position, title, name=None, conversion=lambda x: x):
         self.position = position
         self.function = conversion
         self.description = title
+        self.name = name
+        
+    def __set_name__(self, owner, name):
+        self.name = name
         
-    @staticmethod
-    def transform(func, value):
-        return func(value)
-    
     def __get__(self, object, class_):
-        # print(f"get {object} {class_}")
-        if object is not None:
-            func = self.function
-            return self.transform(self.function, object.args[self.position])
+        if object is None:
+            return self
+        value = self.function(object.args[self.position])
+        object.__dict__[self.name] = value
+        return value
 
 class Text(Field):
     def __init__(self, position, title):
@@ -103,6 +121,28 @@ class Text(Field):
         """
         return value.decode("ascii")
 
+class TextTuple(Field):
+    """A run of positions, each decoded to text, as one tuple.
+    
+    >>> class Sample(Sentence):
+    ...     items = TextTuple(1, 4, "Items")
+    >>> Sample(b'Sample', b'a', b'', b'c', b'd').items
+    ('a', '', 'c')
+    """
+    def __init__(self, start, stop, title):
+        self.start = start
+        self.stop = stop
+        self.description = title
+    
+    def __get__(self, object, class_):
+        if object is None:
+            return self
+        # Join, decode and split; see nmeatools.nmea_data_eager.Sentence._args.
+        args = object.args[self.start:self.stop]
+        value = tuple(b','.join(args).decode('ascii').split(',')) if args else ()
+        object.__dict__[self.name] = value
+        return value
+
 class Integer(Field):
     def __init__(self, position, title):
         super().__init__(position, title, conversion=self.nint)
@@ -115,9 +155,7 @@ class Integer(Field):
         >>> Integer.nint(b'123')
         123
         """
-        if len(value) == 0:
-            return None
-        return int(value)
+        return int(value) if value else None
 
 class Float(Field):
     def __init__(self, position, title):
@@ -131,9 +169,10 @@ class Float(Field):
         >>> Float.nfloat(b'123.45')
         123.45
         """
-        if len(value) == 0:
-            return None
-        return float(value)
+        return float(value) if value else None
+
+# Digit runs are decoded from the byte values after an isdigit() check,
+# as explained above utc_time() in nmeatools.nmea_data_eager.
 
 class UTC_Time(Field):
     def __init__(self, position, title):
@@ -146,9 +185,15 @@ class UTC_Time(Field):
     
         >>> UTC_Time.utc_time(b'123456.000')
         (12, 34, 56.0)
+        >>> UTC_Time.utc_time(b' 23456.000')
+        Traceback (most recent call last):
+        ...
+        ValueError: invalid time b' 23456.000'
         """
         if source:
-            return int(source[:2]), int(source[2:4]), float(source[4:])
+            if not (len(source) >= 4 and source[:4].isdigit()):
+                raise ValueError(f"invalid time {source!r}")
+            return (source[0]-48)*10 + source[1]-48, (source[2]-48)*10 + source[3]-48, float(source[4:])
         return None, None, None
 
 class UTC_Date(Field):
@@ -162,9 +207,15 @@ class UTC_Date(Field):
 
         >>> UTC_Date.utc_date(b'091056')
         (9, 10, 56)
+        >>> UTC_Date.utc_date(b'09 056')
+        Traceback (most recent call last):
+        ...
+        ValueError: invalid date b'09 056'
         """
         if source:
-            return int(source[:2]), int(source[2:4]), int(source[4:])
+            if not (len(source) == 6 and source.isdigit()):
+                raise ValueError(f"invalid date {source!r}")
+            return (source[0]-48)*10 + source[1]-48, (source[2]-48)*10 + source[3]-48, (source[4]-48)*10 + source[5]-48
         return None, None, None
 
 class LatAngle(Field):
@@ -179,11 +230,17 @@ class LatAngle(Field):
     
         >>> LatAngle.lat(b'2543.7024')
         (25, 43.7024)
+        >>> LatAngle.lat(b' 543.7024')
+        Traceback (most recent call last):
+        ...
+        ValueError: invalid latitude b' 543.7024'
         """
         if len(source) == 0: return None, None
-        dd= int(source[:2])
+        if not (len(source) >= 2 and source[:2].isdigit()):
+            raise ValueError(f"invalid latitude {source!r}")
+        dd= (source[0]-48)*10 + source[1]-48
         mm= float(source[2:])
-        return int(dd), float(mm)
+        return dd, mm
 
 class LonAngle(Field):
     """Note that the hemisphere information (E/W) isn't present."""
@@ -197,39 +254,64 @@ class LonAngle(Field):
     
         >>> LonAngle.lon(b'08014.5267')
         (80, 14.5267)
+        >>> LonAngle.lon(b'0-014.5267')
+        Traceback (most recent call last):
+        ...
+        ValueError: invalid longitude b'0-014.5267'
         """
         if len(source) == 0: return None, None
-        dd= int(source[:3])
+        if not (len(source) >= 3 and source[:3].isdigit()):
+            raise ValueError(f"invalid longitude {source!r}")
+        dd= (source[0]-48)*100 + (source[1]-48)*10 + source[2]-48
         mm= float(source[3:])
-        return int(dd), float(mm)
+        return dd, mm
 
 class Latitude(Field):
-    """Two source fields are combined: the angle and the hemisphere (N/S)."""
-    def __init__(self, pos_angle, pos_h, title):
-        self.pos_angle = pos_angle
-        self.pos_h = pos_h
+    """Two fields are combined: the angle and the hemisphere (N/S).
+    
+    These are named attributes of the sentence, so the values they've
+    already converted and cached are used rather than parsed again.
+    """
+    def __init__(self, angle, hemisphere, title):
+        self.angle = angle
+        self.hemisphere = hemisphere
         self.description = title
         
     def __get__(self, object, class_):
-        # print(f"get {object} {class_}")
-        if object.args[self.pos_angle] and  object.args[self.pos_h]:
-            lat_deg, lat_min = LatAngle.lat(object.args[self.pos_angle])
-            lat_h = object.args[self.pos_h]
-            return (lat_deg + lat_min/60) * (-1 if lat_h == b'S' else +1)
+        if object is None:
+            return self
+        value = None
+        lat_deg, lat_min = getattr(object, self.angle)
+        lat_h = getattr(object, self.hemisphere)
+        if lat_deg is not None and lat_h:
+            value = (lat_deg + lat_min/60) * (-1 if lat_h == 'S' else +1)
+        object.__dict__[self.name] = value
+        return value
         
 class Longitude(Field):
-    """Two source fields are combined: the angle and the hemisphere (E/W)."""
-    def __init__(self, pos_angle, pos_h, title):
-        self.pos_angle = pos_angle
-        self.pos_h = pos_h
+    """Two fields are combined: the angle and the hemisphere (E/W).
+    
+    Like :class:`Latitude`, these are named attributes of the sentence.
+    """
+    def __init__(self, angle, hemisphere, title):
+        self.angle = angle
+        self.hemisphere = hemisphere
         self.description = title
         
     def __get__(self, object, class_):
-        # print(f"get {object} {class_}")
-        if object.args[self.pos_angle] and  object.args[self.pos_h]:
-            lon_deg, lon_min = LonAngle.lon(object.args[self.pos_angle])
-            lon_h = object.args[self.pos_h]
-            return (lon_deg + lon_min/60) * (-1 if lon_h == b'W' else +1)
+        if object is None:
+            return self
+        value = None
+        lon_deg, lon_min = getattr(object, self.angle)
+        lon_h = getattr(object, self.hemisphere)
+        if lon_deg is not None and lon_h:
+            value = (lon_deg + lon_min/60) * (-1 if lon_h == 'W' else +1)
+        object.__dict__[self.name] = value
+        return value
+
+# Map each sentence header to its :class:`Sentence` subclass.
+# Subclasses add themselves as they're defined.
+_REGISTRY = {}
 
 @logged
 class Sentence:
@@ -265,26 +347,38 @@ class Sentence:
     3.3
 
     """
+    _header = None  # Set for each subclass.
+    def __init_subclass__(cls, **kw):
+        super().__init_subclass__(**kw)
+        cls._header = cls.__name__.encode('ascii')
+        cls._name = cls.__name__
+        _REGISTRY[cls._header] = cls
+        
     def __init__(self, *args):
         self.args = args
-        self._name = self.args[0].decode('ascii')
+        # Usually the header is the class name, which doesn't need to be decoded.
+        if args[0] != self._header:
+            self._name = args[0].decode('ascii')
     def __repr__(self):
         return f"{self.__class__.__name__}(*{self.args!r})"
     @property
     def to_json(self):
         return {
             '_class': self.__class__.__name__, 
-            '_args': [a.decode('ascii') for a in self.args]
+            '_args': b','.join(self.args).decode('ascii').split(',')
         }
+    def dumps(self):
+        """The :attr:`to_json` document as compact JSON text."""
+        return _encode(self.to_json)
        
 @logged
-class Sentence_Factory( Callable ):
+class Sentence_Factory:
     """
     Given a sequence of values, locate the class with a name that
     matches the sentence header and instantiate that class.
     
-    This examines all subclasses of :class:`Sentence`. The class names
-    must match the sentence header.
+    This uses all subclasses of :class:`Sentence`, each registered
+    when it's defined. The class names must match the sentence header.
     If there's no match, create an :class:`UnknownSentence` instance.
     
     :params args: The message fields. 
@@ -302,19 +396,15 @@ class Sentence_Factory( Callable ):
     GPWPL 51°28.62′N 0°27.58′W EGLL
     """
     def __init__(self):
-        self.sentence_class_map = {
-            class_.__name__.encode('ascii'): class_ 
-            for class_ in Sentence.__subclasses__()
-        }
+        self.sentence_class_map = _REGISTRY
+        self._get = self.sentence_class_map.get
     def __call__(self, *args):
-        self.log.debug(args)
-        class_= self.sentence_class_map.get(args[0])
+        class_= self._get(args[0])
         if class_:
-            sentence= class_(*args)
-            return sentence
-        else:
-            self.log.debug(f"Don't recognize {args[0]}")
-            return UnknownSentence(*args)
+            return class_(*args)
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(f"Don't recognize {args!r}")
+        return UnknownSentence(*args)
              
 @logged
 class UnknownSentence(Sentence):
@@ -380,8 +470,8 @@ class GPWPL(Sentence):
     lon_angle = LonAngle(3, "Longitude Angle")
     lon_h = Text(4, "E/W Indicator")
     name = Text(5, "Name or ID")
-    latitude = Latitude(1, 2, "Waypoint latitude degrees")
-    longitude = Longitude(3, 4, "Waypoint longitude degrees")
+    latitude = Latitude('lat_angle', 'lat_h', "Waypoint latitude degrees")
+    longitude = Longitude('lon_angle', 'lon_h', "Waypoint longitude degrees")
     def __repr__( self ):
         lat_deg, lat_min = self.lat_angle
         lon_deg, lon_min = self.lon_angle
@@ -407,8 +497,8 @@ class GPGGA(Sentence):
     units_sep = Text(12, 'Seperation Units')
     age = Float(13, 'Age of DGPS data in seconds')
     station = Text(14, 'DGPS Station ID')
-    latitude = Latitude(2, 3, "Waypoint latitude degrees")
-    longitude = Longitude(4, 5, "Waypoint longitude degrees")
+    latitude = Latitude('lat_angle', 'lat_h', "Waypoint latitude degrees")
+    longitude = Longitude('lon_angle', 'lon_h', "Waypoint longitude degrees")
     def __repr__( self ):
         lat_deg, lat_min = self.lat_angle
         lon_deg, lon_min = self.lon_angle
@@ -420,21 +510,16 @@ class GPGGA(Sentence):
             
 class GPGSA(Sentence):
     """GSA - GPS DOP and active satellites
+    
+    >>> s = GPGSA(*b'GPGSA,A,3,29,24,18,14,22,27,,,,,,,2.9,1.5,2.5'.split(b','))
+    >>> s.prns
+    ('29', '24', '18', '14', '22', '27', '', '', '', '', '', '')
+    >>> s.pdop
+    2.9
     """
     mode1 = Text(1, 'Mode 1') # M = Forced 2D/3D, A = Auto 2D/3D
     mode2 = Text(2, 'Mode 2') # 1 = No fix, 2 = 2D, 3 = 3D
-    prn_00 = Text(3, 'Satellite used on channel PRN')
-    prn_01 = Text(4, 'PRN01')
-    prn_02 = Text(5, 'PRN02')
-    prn_03 = Text(6, 'PRN03')
-    prn_04 = Text(7, 'PRN04')
-    prn_05 = Text(8, 'PRN05')
-    prn_06 = Text(9, 'PRN06')
-    prn_07 = Text(10, 'PRN07')
-    prn_08 = Text(11, 'PRN08')
-    prn_09 = Text(12, 'PRN09')
-    prn_10 = Text(13, 'PRN10')
-    prn_11 = Text(14, 'PRN11')
+    prns = TextTuple(3, 15, 'Satellites used on channels PRN 00 to 11')
     pdop = Float(15, 'Position dilution of precision (PDOP)')
     hdop = Float(16, 'Horizontal dilution of precision (HDOP)')
     vdop = Float(17, 'Vertical dilution of precision (VDOP)')
@@ -445,6 +530,10 @@ class GPGSA(Sentence):
 
 class GPRMC(Sentence):
     """RMC - Recommended Minimum Specific GNSS Data
+    
+    >>> s = GPRMC(*b'GPRMC,162823.000,A,2542.9243,N,08013.6310,W,0.14,59.53,180214,,'.split(b','))
+    >>> round(s.latitude,4), round(s.longitude,4)
+    (25.7154, -80.2272)
     """
     time_utc = UTC_Time(1, 'UTC Time')
     status = Text(2, 'Status')
@@ -457,8 +546,8 @@ class GPRMC(Sentence):
     utc_date = UTC_Date(9, 'UTC Date')
     mag_var = Float(10, 'Magnetic variation')
     mag_var_flag = Text(11, 'Magnetic variation')
-    latitude = Latitude(2, 3, "Waypoint latitude degrees")
-    longitude = Longitude(4, 5, "Waypoint longitude degrees")
+    latitude = Latitude('lat_angle', 'lat_h', "Waypoint latitude degrees")
+    longitude = Longitude('lon_angle', 'lon_h', "Waypoint longitude degrees")
     def __repr__( self ):
         lat_deg, lat_min = self.lat_angle
         lon_deg, lon_min = self.lon_angle
@@ -468,14 +557,30 @@ class GPRMC(Sentence):
             f" {self.sog} kt {self.cog}°"
         )
 
-def decode(object):
-    if set(object.keys()) == {'_class', '_args'}:
-        # Mock sentence factory...
-        class_ = eval(object['_class'])
-        return class_(*[a.encode('ascii') for a in object['_args']])
+def decode(object, _registry=_REGISTRY):
+    """JSON object hook to rebuild a :class:`Sentence` from its ``to_json`` form.
+    
+    The class is found in the registry of :class:`Sentence` subclasses;
+    any other object is returned unchanged.
+    
+    >>> decode({'_class': 'GPWPL', '_args': ['GPWPL', '5128.62', 'N', '00027.58', 'W', 'EGLL']})
+    GPWPL 51°28.62′N 0°27.58′W EGLL
+    >>> decode({'_class': 'os', '_args': []})
+    {'_class': 'os', '_args': []}
+    """
+    if len(object) == 2 and '_class' in object and '_args' in object:
+        class_ = _registry.get(object['_class'].encode('ascii'))
+        if class_ is not None:
+            # Join, encode and split, as in TextTuple.
+            return class_(*','.join(object['_args']).encode('ascii').split(b','))
     return object
 
-import doctest
-doctest.testmod(verbose=False)
+# One encoder and one decoder, shared by all sentences.
+_encode = json.JSONEncoder(separators=(',', ':')).encode
+loads = json.JSONDecoder(object_hook=decode).decode
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod(verbose=False)
 
 
@@ -19,9 +19,11 @@ Typical interface to NMEA 0183 requires this kind of serial interface:
 We'll decode NMEA 0183 Sentences. See http://www.robosoft.info/en/technologies/knowledgebase/nmea0183
 
 The checksum is the bitwise exclusive OR of ASCII codes of all characters between the $ and \*.
-This is done with ``reduce(operator.xor, bytes)``
+This is done with :func:`nmeatools.nmea_checksum.xor_fold`, which folds the whole
+body as one integer rather than reducing it a byte at a time.
 
 The listener is an Interator as well as a Context Manager.
+A :class:`FileListener` replays a captured log the same way.
 
 Also -- since messages are ","-separated, it handles the split operation.
 
@@ -79,6 +81,15 @@ Good Messages:
 >>> Listener.validate(m7)
 (b'GPGSV', b'3', b'3', b'10', b'27', b'08', b'303', b'27', b'12', b'00', b'139', b'25')
 
+A checksum that isn't two hex digits is rejected like a wrong checksum:
+
+>>> Listener.validate(b'$GPVTG,59.53,T,,M,0.14,N,0.3,K*5c')
+(b'GPVTG', b'59.53', b'T', b'', b'M', b'0.14', b'N', b'0.3', b'K')
+>>> Listener.validate(b'$GPVTG,59.53,T,,M,0.14,N,0.3,K*5G')
+Traceback (most recent call last):
+  ...
+AssertionError: Invalid checksum
+
 Broken Message, typical case:
 
 >>> b0= b'''42.9243,N,08013.6310,W,0.14,59.53,180214,,*2F\r
@@ -95,15 +106,21 @@ AssertionError: Sentence Fragment
 
 """
 from nmeatools.common import logged, Logging
+from nmeatools.nmea_checksum import xor_fold
 
 from types import SimpleNamespace
-from functools import reduce
-from operator import xor
 import sys
 import logging
+import mmap
 
 import serial
 
+# Value of each hex digit byte, for the two checksum characters.
+# Anything that isn't a hex digit is out of range and can never match.
+HEX_DIGIT = [0x100] * 256
+for value, digit in enumerate(b'0123456789ABCDEF'):
+    HEX_DIGIT[digit] = HEX_DIGIT[digit | 0x20] = value
+
 @logged
 class Listener:
     """Listen to the device, yielding a sequence of sentences.
@@ -129,10 +146,12 @@ class Listener:
         """
         self.options = options
         self.device = None
+        self.buffer = bytearray()
         
     def __enter__(self):
         self.device = serial.Serial(self.options.port, self.options.baud, timeout=self.options.timeout)
         self.log.debug(f"Device: {self.device}")
+        self.buffer = bytearray()
         return self
         
     def __exit__(self, *exc):
@@ -142,23 +161,71 @@ class Listener:
     def __iter__(self):
         return self
         
+    def readline(self):
+        """Get the next line from the device.
+        
+        Rather than let the serial interface read a byte at a time looking
+        for the end of the line, this reads everything that's waiting into
+        :attr:`buffer` and splits the line off locally. A burst of sentences
+        takes one read.
+        
+        :returns: bytes of one line, including the line ending, or an empty
+            bytes object if the device timed out.
+        """
+        while True:
+            end = self.buffer.find(b'\n')
+            if end >= 0:
+                line = bytes(self.buffer[:end+1])
+                del self.buffer[:end+1]
+                return line
+            chunk = self.device.read(self.device.in_waiting or 1)
+            if not chunk:
+                return b''
+            self.buffer += chunk
+        
     def __next__(self):
         """Get a line, validate it for completeness, and split into into fields.
         If the message is valid, the yields a tuple of bytes.
         """
         content = None
         while not content:
-            sentence_bytes = self.device.readline().rstrip()
-            self.log.debug(f"sentence_bytes = {sentence_bytes!r}")
+            sentence_bytes = self.readline().rstrip()
+            if self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug(f"sentence_bytes = {sentence_bytes!r}")
             while not sentence_bytes:
                 self.log.error("Timeout")
-                sentence_bytes = self.device.readline().rstrip()
+                sentence_bytes = self.readline().rstrip()
             try:
                 content = Listener.validate(sentence_bytes)
             except AssertionError as e:
                 self.log.error(f"{e}: {sentence_bytes!r}")
         return content
                 
+    @classmethod
+    def parse_bulk(cls, buffer):
+        """Validate and split every sentence in a buffer of captured NMEA text.
+        
+        This is for replaying a log: the whole buffer is split into lines
+        in one operation, then each line is validated. Lines that fail
+        validation are logged and skipped, the same as :meth:`__next__`.
+        
+        :param buffer: A bytes object with many ``\\r\\n``-terminated sentences.
+        :returns: list of tuples, one per valid sentence, suitable for use with a
+            :class:`Sentence_Factory` instance.
+        
+        >>> Listener.parse_bulk(b'$GPVTG,59.53,T,,M,0.14,N,0.3,K*5C\\r\\n42.9243,N*2F\\r\\n\\r\\n')
+        [(b'GPVTG', b'59.53', b'T', b'', b'M', b'0.14', b'N', b'0.3', b'K')]
+        """
+        sentences = []
+        for sentence_bytes in buffer.splitlines():
+            if not sentence_bytes:
+                continue
+            try:
+                sentences.append(cls.validate(sentence_bytes))
+            except AssertionError as e:
+                cls.log.error(f"{e}: {sentence_bytes!r}")
+        return sentences
+
     @staticmethod
     def validate(sentence_bytes):
         """Validate an NMEA sentence, returning either a tuple of substrings or an 
@@ -172,15 +239,90 @@ class Listener:
         assert sentence_bytes.startswith(b'$'), "Sentence fragment"
         content, _, checksum_txt = sentence_bytes[1:].partition(b"*")
         if checksum_txt:
-            checksum_exp = int(checksum_txt, 16)
-            checksum_act = reduce(xor, content)
+            checksum_txt = checksum_txt.rstrip()
+            assert len(checksum_txt) == 2, "Invalid checksum"
+            checksum_exp = HEX_DIGIT[checksum_txt[0]] << 4 | HEX_DIGIT[checksum_txt[1]]
+            checksum_act = xor_fold(content)
             assert checksum_exp == checksum_act, "Invalid checksum"
         return tuple(content.split(b','))
 
-import doctest
-doctest.testmod(verbose=False)
+@logged
+class FileListener:
+    """Replay a captured NMEA log file, yielding a sequence of sentences.
+    
+    This is the same kind of Interable and Context Manager as :class:`Listener`,
+    but the source is a file of ``\\r\\n``-terminated sentences.
+    The file is memory-mapped and read one line at a time, so it isn't
+    copied into a single bytes object; the kernel is advised that access
+    is sequential so it can read ahead.
+    
+    ::
+    
+        with FileListener(Path("capture.nmea")) as GPS:
+            for sentence in GPS:
+                print(sentence)
+    
+    >>> import tempfile, pathlib
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     path = pathlib.Path(directory) / "capture.nmea"
+    ...     _ = path.write_bytes(b'$GPVTG,59.53,T,,M,0.14,N,0.3,K*5C\\r\\n42.9243,N*2F\\r\\n')
+    ...     with FileListener(path) as GPS:
+    ...         list(GPS)
+    [(b'GPVTG', b'59.53', b'T', b'', b'M', b'0.14', b'N', b'0.3', b'K')]
+    """
+    def __init__(self, path):
+        """Create the FileListener instance.
+        
+        :param path: The path to a captured log file.
+        """
+        self.path = path
+        self.file = None
+        self.map = None
+        
+    def __enter__(self):
+        self.file = open(self.path, 'rb')
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # An empty file can't be mapped; there are no sentences.
+            self.map = None
+        else:
+            if hasattr(self.map, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                self.map.madvise(mmap.MADV_SEQUENTIAL)
+        return self
+        
+    def __exit__(self, *exc):
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        self.file.close()
+        self.file = None
+        
+    def __iter__(self):
+        return self
+        
+    def __next__(self):
+        """Get a line, validate it for completeness, and split into into fields.
+        Lines that fail validation are logged and skipped.
+        """
+        if self.map is None:
+            raise StopIteration
+        while True:
+            sentence_bytes = self.map.readline()
+            if not sentence_bytes:
+                raise StopIteration
+            sentence_bytes = sentence_bytes.rstrip()
+            if not sentence_bytes:
+                continue
+            try:
+                return Listener.validate(sentence_bytes)
+            except AssertionError as e:
+                self.log.error(f"{e}: {sentence_bytes!r}")
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod(verbose=False)
 
-if __name__ == "__main__":    
     BU_353_Antenna = SimpleNamespace(
         port = "/dev/cu.usbserial",
         baud = 4800,
@@ -9,13 +9,15 @@ Merge waypoints from two sources:
 The output is a combined list with duplicated locations removed.
 This becomes the new master.
 """
-from nmeatools.waypoint_to_gpx import waypoints_to_gpx
+from nmeatools.waypoint_to_gpx import waypoints_to_gpx, gpx_text
 from nmeatools.nmea_data_lazy import Sentence_Factory
-from nmeatools.haversine import nm_haversine
+from nmeatools.haversine import nm_haversine, haversine_to, cos_latitudes, NM
 from nmeatools.common import logged, Logging
 
 from xml.etree import ElementTree
 from pathlib import Path
+from bisect import bisect_left, bisect_right
+from math import degrees
 import sys
 import logging
 
@@ -35,10 +37,10 @@ class Waypoint:
     def args(self):
         lat_h = b'N' if self.latitude > 0 else b'S'
         lat_deg, lat_min = divmod(abs(self.latitude), 1)
-        lat_nmea = '{:02d}{:02.4f}'.format(int(lat_deg), lat_min*60).encode('ascii')
+        lat_nmea = b'%02d%.4f' % (lat_deg, lat_min*60)
         lon_h = b'E' if self.longitude > 0 else b'W'
         lon_deg, lon_min = divmod(abs(self.longitude), 1)
-        lon_nmea = '{:03d}{:02.4f}'.format(int(lon_deg), lon_min*60).encode('ascii')
+        lon_nmea = b'%03d%.4f' % (lon_deg, lon_min*60)
         return b'GPWPL', lat_nmea, lat_h, lon_nmea, lon_h, self.name.encode('ascii')
     def distance(self, other):
         """Distance in NM."""
@@ -47,53 +49,132 @@ class Waypoint:
         
 gpx_namespace = {'gpx': 'http://www.topografix.com/GPX/1/1'}
 
+def waypoint_from_element(doc, namespace):
+    return Waypoint(
+        doc.attrib['lat'], doc.attrib['lon'],
+        doc.findtext('gpx:name', None, namespace),
+        doc.findtext('gpx:time', None, namespace),
+        doc.findtext('gpx:sym', None, namespace),
+    )
+
 def waypoint_iter(root, namespace):
+    """Yield the waypoints of an already-parsed GPX document.
+    
+    :func:`merge` reads files with :func:`waypoint_stream`; this is kept
+    as public API for callers that already have an element tree.
+    """
     for doc in root.findall('gpx:wpt', namespace):
-        latitude = doc.attrib['lat']
-        longitude = doc.attrib['lon']
-        name_element = doc.find('gpx:name', namespace)
-        name = name_element.text if name_element is not None else None
-        time_element = doc.find('gpx:time', namespace)
-        time = time_element.text if time_element is not None else None
-        sym_element = doc.find('gpx:sym', namespace)
-        sym = sym_element.text if sym_element is not None else None
-        yield Waypoint(latitude, longitude, name, time, sym)
+        yield waypoint_from_element(doc, namespace)
+
+def waypoint_stream(path, namespace):
+    """Parse a GPX file incrementally, yielding its waypoints.
+    
+    Each ``<wpt>`` is converted when its end tag is parsed, then cleared,
+    so the waypoints' contents are never all held in memory at once.
+    """
+    wpt_tag = f"{{{namespace['gpx']}}}wpt"
+    for event, doc in ElementTree.iterparse(str(path)):
+        if doc.tag == wpt_tag:
+            yield waypoint_from_element(doc, namespace)
+            doc.clear()
         
+def latitude_index(latitudes, distance):
+    """Index points by latitude to find the ones that could be near a given point.
+    
+    A great-circle distance is never less than the distance along the
+    meridian, so a point within ``distance`` NM is also within a band of
+    latitude ``distance/NM`` radians wide. Sorting the latitudes lets
+    :mod:`bisect` find that band without measuring every point.
+    
+    :param latitudes: Latitudes of the indexed points.
+    :param distance: The search radius, NM.
+    :returns: function of a latitude that returns the positions of the
+        indexed points in its band, in their original order.
+    
+    >>> band = degrees(GPS_ERROR / NM)
+    >>> nearby = latitude_index([10.0 + band/2, 10.0 - band*1.01, 10.0, 10.0 + band*0.99], GPS_ERROR)
+    >>> nearby(10.0)
+    [0, 2, 3]
+    """
+    order = sorted(range(len(latitudes)), key=latitudes.__getitem__)
+    sorted_lat = [latitudes[k] for k in order]
+    band = degrees(distance / NM) * 1.000001  # A hair wider, for float rounding.
+    def nearby(lat):
+        low = bisect_left(sorted_lat, lat - band)
+        high = bisect_right(sorted_lat, lat + band)
+        return sorted(order[low:high])
+    return nearby
+
+GPS_ERROR = 32/6060  # 32′ GPS Error Circle, NM
+
 logger = logging.getLogger("merge")
 
 def merge(master_path=Path("/Volumes/NO NAME/WaypointsRoutesTracks.gpx"), 
     update_path = Path('/Users/slott/Documents/Sailing/Cruise History/routes/waypoints.gpx')
     ):
-    GPS_ERROR = 32/6060  # 32′ GPS Error Circle
-    
-    master_tree = ElementTree.parse(str(master_path))
-    master_root = master_tree.getroot()
-
     logger.info(f"MASTER from {master_path}")
-    base = list(waypoint_iter(master_root, gpx_namespace))
+    base = list(waypoint_stream(master_path, gpx_namespace))
+    base_lat = [b_wpt.latitude for b_wpt in base]
+    base_lon = [b_wpt.longitude for b_wpt in base]
+    base_cos = cos_latitudes(base_lat)  # Once, not once per comparison.
+    nearby = latitude_index(base_lat, GPS_ERROR)
     for i in range(len(base)):
-        for j in range(i):
-            d = base[i].distance(base[j]) 
+        # Distances from this waypoint to the previous ones that could be close.
+        previous = [j for j in nearby(base_lat[i]) if j < i]
+        distances = haversine_to(
+            [base_lat[j] for j in previous], [base_lon[j] for j in previous],
+            base_lat[i], base_lon[i], cos_lat=[base_cos[j] for j in previous])
+        for j, d in zip(previous, distances):
             if d <= GPS_ERROR:
                 logger.info(f"{base[i].name} possible duplicate {d:.4f} {base[j].name}")
 
-    update_tree = ElementTree.parse(str(update_path))
-    update_root = update_tree.getroot()
-
     logger.info(f"UPDATE from {update_path}")
     unique_waypoints = []
-    for wpt in waypoint_iter(update_root, gpx_namespace):
-        closest = min((wpt.distance(b_wpt), b_wpt) for b_wpt in base)
-        d, close_wpt = closest
-        if d <= GPS_ERROR:
+    for wpt in waypoint_stream(update_path, gpx_namespace):
+        # If the closest master waypoint is within GPS_ERROR, it's one of these.
+        candidates = nearby(wpt.latitude)
+        distances = haversine_to(
+            [base_lat[j] for j in candidates], [base_lon[j] for j in candidates],
+            wpt.latitude, wpt.longitude, cos_lat=[base_cos[j] for j in candidates])
+        d = min(distances, default=None)
+        if d is not None and d <= GPS_ERROR:
+            close_wpt = base[candidates[distances.index(d)]]
             logger.info(f"{wpt.name} near {d:.4f} {close_wpt.name}")
         else:
             unique_waypoints.append(wpt)
 
     # Emit GPX file.
-    document = waypoints_to_gpx(unique_waypoints, 'merged_waypoints.gpx', "2017 Merged Red Ranger Waypoints.")
-    print(document.toprettyxml(indent="  "))
+    gpx = waypoints_to_gpx(unique_waypoints, 'merged_waypoints.gpx', "2017 Merged Red Ranger Waypoints.")
+    print(gpx_text(gpx))
     
+__test__ = {
+    'latitude_index': '''\
+Pruning with the latitude band finds the same close pairs as measuring every pair.
+
+>>> import random
+>>> rng = random.Random(42)
+>>> master = [(25 + rng.uniform(0, .01), -80 + rng.uniform(0, .01)) for _ in range(320)]
+>>> update = [(25 + rng.uniform(0, .01), -80 + rng.uniform(0, .01)) for _ in range(330)]
+>>> lat, lon = [p[0] for p in master], [p[1] for p in master]
+>>> nearby = latitude_index(lat, GPS_ERROR)
+>>> def close(points, prune, before=False):
+...     pairs = set()
+...     for i, (lat_0, lon_0) in enumerate(points):
+...         js = nearby(lat_0) if prune else range(len(master))
+...         for j in js:
+...             if before and j >= i:
+...                 continue
+...             if nm_haversine(lat_0, lon_0, lat[j], lon[j]) <= GPS_ERROR:
+...                 pairs.add((i, j))
+...     return pairs
+>>> duplicates, near = close(master, False, before=True), close(update, False)
+>>> len(duplicates), len(near)
+(13, 37)
+>>> close(master, True, before=True) == duplicates, close(update, True) == near
+(True, True)
+''',
+}
+
 if __name__ == "__main__":
     with Logging(stream=sys.stderr, level=logging.INFO):
         merge()
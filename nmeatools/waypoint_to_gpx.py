@@ -46,7 +46,6 @@ optional arguments:
 from nmeatools.nmea_data_eager import Decoder
 from nmeatools.common import logged, Logging
 
-from xml.dom import getDOMImplementation, XMLNS_NAMESPACE, XML_NAMESPACE
 import xml.etree.ElementTree as xml
 from pathlib import Path
 import argparse
@@ -57,67 +56,83 @@ NAMESPACE = "http://www.topografix.com/GPX/1/1"
 
 logger = logging.getLogger(__name__)
 
-def build_gpx(document, name, description):
+def build_gpx(name, description):
     """Create the ``<gpx>`` Element, inserting metadata.
     
-    :param document: The root document
     :param name: The string name to put in the metadata
     :param description: the string description to put in the metadata
     :returns: the ``<gpx>`` element
     """
-    gpx = document.createElementNS(NAMESPACE, "gpx")
-    gpx.setAttribute("version", "1.1")
-    gpx.setAttribute("creator", "NMEA-Tools-1.1")
-    # Hacky workaround to get a default namespace injected
-    gpx.setAttribute("xmlns", NAMESPACE)
-    metadata = document.createElementNS(NAMESPACE, "metadata")
-    name_node = document.createElementNS(NAMESPACE, "name")
-    name_node.appendChild(document.createTextNode(name))
-    metadata.appendChild(name_node)
-    desc_node = document.createElementNS(NAMESPACE, "desc")
-    desc_node.appendChild(document.createTextNode(description))
-    metadata.appendChild(desc_node)
-    gpx.appendChild(metadata)
-    document.appendChild(gpx)
+    # The default namespace is an attribute; the tags are left unqualified.
+    gpx = xml.Element("gpx", version="1.1", creator="NMEA-Tools-1.1", xmlns=NAMESPACE)
+    metadata = xml.SubElement(gpx, "metadata")
+    xml.SubElement(metadata, "name").text = name
+    xml.SubElement(metadata, "desc").text = description
     return gpx
 
-def build_waypoint_location(document, s):
+def build_waypoint_location(s):
     """Create a ``<wpt>`` element, inserting a ``<name>`` element.
     
-    :param document: The root document
     :param s: An :class:`nmeatools.nmea_data.GPWPL` instance.
     :returns: the ``<wpt>`` e,ement
     """
     assert s._name == 'GPWPL', f"Unexpected NMEA capture document {s}"
-    wpt = document.createElementNS(NAMESPACE, "wpt")
-    wpt.setAttribute("lat", str(round(s.latitude,4)))
-    wpt.setAttribute("lon", str(round(s.longitude,4)))
-    name = document.createElementNS(NAMESPACE, "name")
-    name.appendChild(document.createTextNode(s.name))
-    wpt.appendChild(name)
+    wpt = xml.Element("wpt", lat=str(round(s.latitude,4)), lon=str(round(s.longitude,4)))
+    xml.SubElement(wpt, "name").text = s.name
     return wpt
 
-def build_routepoint(document, s, sym=None):
+def build_routepoint(s, sym=None):
     """Create a ``<rtept>`` element, inserting a ``<name>`` element (optionally a ``<sym>``).
 
-    :param document: The root document
     :param s: An :class:`nmeatools.nmea_data.GPWPL` instance.
     :param sym: An optional string with a symbol name to include.
     :returns: the ``<rtept>`` e,ement    
     """
     assert s._name == 'GPWPL', f"Unexpected NMEA capture document {s}"
-    wpt = document.createElementNS(NAMESPACE, "rtept")
-    wpt.setAttribute("lat", str(round(s.latitude,4)))
-    wpt.setAttribute("lon", str(round(s.longitude,4)))
-    name = document.createElementNS(NAMESPACE, "name")
-    name.appendChild(document.createTextNode(s.name))
-    wpt.appendChild(name)
+    wpt = xml.Element("rtept", lat=str(round(s.latitude,4)), lon=str(round(s.longitude,4)))
+    xml.SubElement(wpt, "name").text = s.name
     if sym:
-        sym_tag = document.createElementNS(NAMESPACE, "sym")
-        sym_tag.appendChild(document.createTextNode(sym))
-        wpt.appendChild(sym_tag)
+        xml.SubElement(wpt, "sym").text = sym
     return wpt
 
+def _indent_tree(element, space="  ", level=0):
+    """Indent an element tree in place, for versions before Python 3.9,
+    which lack :func:`xml.etree.ElementTree.indent`. The whitespace is the same.
+    
+    >>> root = xml.fromstring("<a><b><c>text</c></b><d/></a>")
+    >>> _indent_tree(root)
+    >>> print(xml.tostring(root, encoding="unicode"))
+    <a>
+      <b>
+        <c>text</c>
+      </b>
+      <d />
+    </a>
+    """
+    if not len(element):
+        return
+    child_indentation = "\n" + (level+1) * space
+    if not element.text or not element.text.strip():
+        element.text = child_indentation
+    for child in element:
+        _indent_tree(child, space, level+1)
+        if not child.tail or not child.tail.strip():
+            child.tail = child_indentation
+    if not child.tail.strip():
+        child.tail = "\n" + level * space
+
+_indent = getattr(xml, 'indent', _indent_tree)
+
+def gpx_text(gpx):
+    """Serialize a ``<gpx>`` element as an indented XML document.
+    
+    :param gpx: The ``<gpx>`` element from :func:`waypoints_to_gpx` or :func:`route_to_gpx`.
+    :returns: the text of the document.
+    """
+    _indent(gpx, space="  ")
+    body = xml.tostring(gpx, encoding="unicode", short_empty_elements=False)
+    return f'<?xml version="1.0" ?>\n{body}\n'
+
 def waypoints_to_gpx(sentences, name, description):
     """
     Create GPX doc with waypoints.
@@ -127,16 +142,13 @@ def waypoints_to_gpx(sentences, name, description):
     :param description: the string description to put in the metadata
     :returns: ``<gpx>`` element containing the ``<wpt>`` waypoints.
     """
-    impl = getDOMImplementation()
-    document = impl.createDocument(None, None, None)
-    gpx = build_gpx(document, name, description)
+    gpx = build_gpx(name, description)
     
     for s in sentences:
         logger.info(f"{s}")
-        wpt = build_waypoint_location(document, s)        
-        gpx.appendChild(wpt)
+        gpx.append(build_waypoint_location(s))
 
-    return document
+    return gpx
 
 def route_to_gpx(sentences, name, description):
     """
@@ -167,57 +179,53 @@ def route_to_gpx(sentences, name, description):
         else:
             assert s._name not in ('GPWPL', 'GPRTE'), f"Unexpected NMEA capture document {s}"
         
-    impl = getDOMImplementation()
-    document = impl.createDocument(None, None, None)
-    gpx = build_gpx(document, name, description)
+    gpx = build_gpx(name, description)
     
-    rte = document.createElementNS(NAMESPACE, 'rte')
-    name_node = document.createElementNS(NAMESPACE, "name")
-    name_node.appendChild(document.createTextNode(", ".join(names)))
-    rte.appendChild(name_node)
-    desc_node = document.createElementNS(NAMESPACE, "desc")
-    desc_node.appendChild(document.createTextNode(""))
-    rte.appendChild(desc_node)
-    gpx.appendChild(rte)
+    rte = xml.SubElement(gpx, 'rte')
+    xml.SubElement(rte, "name").text = ", ".join(names)
+    xml.SubElement(rte, "desc").text = ""
 
     for rp in route_points:
         s = waypoints[rp]
-        wpt = build_routepoint(document, s)        
-        rte.appendChild(wpt)
+        rte.append(build_routepoint(s))
 
-    return document
+    return gpx
     
-def convert_waypoints(waypoints_path, description="2017 Waypoints from Red Ranger chartplotter."):
+def convert_waypoints(waypoints_path, description="2017 Waypoints from Red Ranger chartplotter.", sentence_list=None):
     """
     Load JSON document with GPWPL sentences; return GPX representation.
     
     :param waypoints_path: Path with location of waypoints in JSON notation.
     :param description: Description to insert into the metadata.
-    :returns: root document with ``<gpx>`` and ``<wpt>`` tags.
+    :param sentence_list: The sentences, if the document has already been decoded.
+    :returns: text of a document with ``<gpx>`` and ``<wpt>`` tags.
     """
-    logger.info(f"Read waypoints from {waypoints_path}")
-    text = waypoints_path.read_text()
-    sentence_list = Decoder().decode(text)
-    document = waypoints_to_gpx(sentence_list, waypoints_path.name, description)
+    if sentence_list is None:
+        logger.info(f"Read waypoints from {waypoints_path}")
+        text = waypoints_path.read_text()
+        sentence_list = Decoder().decode(text)
+    gpx = waypoints_to_gpx(sentence_list, waypoints_path.name, description)
     items = len(sentence_list)
     logger.info(f"{items} sentences read")
-    return document.toprettyxml(indent="  ")
+    return gpx_text(gpx)
 
-def convert_route(route_path, description="2017 Waypoints from Red Ranger chartplotter."):
+def convert_route(route_path, description="2017 Waypoints from Red Ranger chartplotter.", sentence_list=None):
     """
     Load JSON document with GPWPL and GPRTE sentences; return GPX representation.
     
     :param route_path: Path with location of routes in JSON notation.
     :param description: Description to insert into the metadata.
-    :returns: root document with ``<gpx>`` and ``<rte>`` and ``<rtept>`` tags.
+    :param sentence_list: The sentences, if the document has already been decoded.
+    :returns: text of a document with ``<gpx>`` and ``<rte>`` and ``<rtept>`` tags.
     """
-    logger.info(f"Read route from {route_path}")
-    text = route_path.read_text()
-    sentence_list = Decoder().decode(text)
-    document = route_to_gpx(sentence_list, route_path.name, description)
+    if sentence_list is None:
+        logger.info(f"Read route from {route_path}")
+        text = route_path.read_text()
+        sentence_list = Decoder().decode(text)
+    gpx = route_to_gpx(sentence_list, route_path.name, description)
     items = len(sentence_list)
     logger.info(f"{items} sentences read")
-    return document.toprettyxml(indent="  ")
+    return gpx_text(gpx)
 
 def get_options(argv):
     """
@@ -250,6 +258,7 @@ def main():
     """
     result = 0  # All OK
     options = get_options(sys.argv[1:])
+    decoder = Decoder()
     for name in options.input:
         input_path = Path(name)
         output_path = input_path.with_suffix(options.format)
@@ -257,21 +266,21 @@ def main():
             logger.error("Output file already exists.")
             result = 1  # Something failed
             continue
-        # Scan file for sentences.
+        # Scan file for sentences. These are decoded once, and given to the converter.
+        logger.info(f"Read {input_path}")
         text = input_path.read_text()
-        types = set(s._name for s in Decoder().decode(text))
+        sentence_list = decoder.decode(text)
+        types = set(s._name for s in sentence_list)
         if {'GPRTE', 'GPWPL'} <= types:
-            gpx = convert_route(input_path, options.desc)
+            gpx = convert_route(input_path, options.desc, sentence_list)
         elif {'GPWPL'} <= types:
-            gpx = convert_waypoints(input_path, options.desc)
+            gpx = convert_waypoints(input_path, options.desc, sentence_list)
         else:
             logger.error(f"Sorry, couldn't process file of {types} sentences.")
             result = 1  # Something failed
             continue
         logger.info(f"Writing {output_path}")
-        with output_path.open('w') as target:
-            target.write(gpx)
-            target.write('\n')
+        output_path.write_text(gpx + '\n', encoding='utf-8')
     sys.exit(result)
 
 if __name__ == "__main__":
@@ -12,7 +12,9 @@ OK
 
 import unittest
 import doctest
+import nmeatools.haversine
 import nmeatools.nmea_capture
+import nmeatools.nmea_checksum
 import nmeatools.nmea_data_eager
 import nmeatools.nmea_data_lazy
 import nmeatools.nmea_device
@@ -20,7 +22,9 @@ import nmeatools.waypoint_merge
 import nmeatools.waypoint_to_gpx
 
 def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite(nmeatools.haversine))
     tests.addTests(doctest.DocTestSuite(nmeatools.nmea_capture))
+    tests.addTests(doctest.DocTestSuite(nmeatools.nmea_checksum))
     tests.addTests(doctest.DocTestSuite(nmeatools.nmea_data_eager))
     tests.addTests(doctest.DocTestSuite(nmeatools.nmea_data_lazy))
     tests.addTests(doctest.DocTestSuite(nmeatools.nmea_device))